@@ -1,18 +1,36 @@
 import os
+import re
 import json
 import time
+import functools
+import atexit
+import asyncio
+import shutil
+import mimetypes
+import threading
+import orjson
 import requests
 import datetime
 import bcrypt
-from dotenv import dotenv_values
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from dotenv import load_dotenv
 from pathlib import Path
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 
 import firebase_admin
 from firebase_admin import credentials, firestore
 
+# Collapses spaces, slashes, colons and anything else filesystem-unsafe in
+# job titles/companies into underscores in one regex pass.
+_SANITIZE = re.compile(r"[^\w.-]+")
+
 UPLOAD_DIR = "uploads"
 COOKIE_DIR = "cookies"
 SCREENSHOT_DIR = "debug/screenshots"
@@ -20,8 +38,57 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(COOKIE_DIR, exist_ok=True)
 os.makedirs(SCREENSHOT_DIR, exist_ok=True)
 
-config = dotenv_values("config.env")
-DEFAULT_EMAIL = config.get("DEFAULT_EMAIL", "me@jobblixor.local")
+# Load config.env into the process environment once; bind the hot values to
+# module constants so fetch_jobs does a LOAD_FAST instead of a dict lookup.
+load_dotenv("config.env")
+SERP_API_KEY = os.environ["SERP_API_KEY"]
+DEFAULT_EMAIL = os.environ.get("DEFAULT_EMAIL", "me@jobblixor.local")
+DEBUG_SCREENSHOTS = bool(os.environ.get("DEBUG_SCREENSHOTS"))
+
+# One session for all SerpAPI calls: keep-alive skips the TLS+TCP setup
+# that a bare requests.get pays on every search.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+# argon2id for all new hashes; bcrypt stays importable to verify legacy
+# records (hashes starting with $2). Hashing is deliberately slow, so /submit
+# runs it on a worker thread to overlap with uploads and the Firestore read.
+PH = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+HASH_POOL = ThreadPoolExecutor(max_workers=4)
+
+def verify_password(stored_hash, password):
+    if not stored_hash:
+        return False
+    if stored_hash.startswith("$2"):
+        return bcrypt.checkpw(password.encode(), stored_hash.encode())
+    try:
+        PH.verify(stored_hash, password)
+        return True
+    except VerifyMismatchError:
+        return False
+
+# Background disk writes that nothing downstream waits on. Their futures are
+# never joined, so every submit attaches _report_background_error — otherwise
+# a bad path or full disk would fail without a trace.
+IO_POOL = ThreadPoolExecutor(max_workers=2)
+
+def _report_background_error(label):
+    def report(future):
+        exc = future.exception()
+        if exc:
+            print(f"❌ Background write failed ({label}): {exc}")
+    return report
+
+def utc_now_iso():
+    # Called once per request and reused for every field that needs "now";
+    # utcnow() is deprecated as of Python 3.12.
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+def _write_json_atomic(path, payload):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
 
 # Firebase setup (securely from environment variable)
 firebase_credentials = os.environ.get("FIREBASE_CREDENTIALS")
@@ -31,9 +98,208 @@ cred = credentials.Certificate(json.loads(firebase_credentials))
 firebase_admin.initialize_app(cred)
 db = firestore.client()
 
+# Firestore rejects commits above 500 writes / 10 MiB; stay comfortably under.
+MAX_WRITES_PER_BATCH = 450
+
+def commit_batches(ops, max_per=MAX_WRITES_PER_BATCH):
+    """Commit (doc_ref, fields) update pairs, chunked to fit Firestore's
+    per-commit cap. Multiple chunks are committed in parallel."""
+    def commit_one(chunk):
+        batch = db.batch()
+        for ref, fields in chunk:
+            batch.update(ref, fields)
+        batch.commit()
+
+    chunks = [ops[i:i + max_per] for i in range(0, len(ops), max_per)]
+    if len(chunks) == 1:
+        commit_one(chunks[0])
+    else:
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            list(pool.map(commit_one, chunks))
+
+@functools.lru_cache(maxsize=1024)
+def user_ref(email):
+    # DocumentReference construction validates and formats the path each
+    # time; every call site hits Firestore for the same handful of users.
+    return db.collection("users").document(email)
+
 app = Flask(__name__)
 CORS(app)
 
+def resume_payload(path):
+    # Keyed on mtime so a re-uploaded resume with the same name isn't served
+    # from a stale cache entry.
+    return _resume_payload(path, os.path.getmtime(path))
+
+@functools.lru_cache(maxsize=32)
+def _resume_payload(path, mtime):
+    with open(path, "rb") as f:
+        data = f.read()
+    return {
+        "name": os.path.basename(path),
+        "mimeType": mimetypes.guess_type(path)[0] or "application/pdf",
+        "buffer": data
+    }
+
+async def fill_greenhouse(page, user_data):
+    # One evaluate fills every text field in a single Playwright round-trip
+    # instead of four. The resume has to go through set_input_files (JS
+    # can't attach local files) and must land before the submit click.
+    await page.evaluate(
+        """(d) => {
+            document.querySelector("input[name='first_name']").value = d.first_name;
+            document.querySelector("input[name='last_name']").value = d.last_name;
+            document.querySelector("input[type='email']").value = d.email;
+            document.querySelector("input[type='tel']").value = d.phone;
+        }""",
+        {
+            "first_name": user_data["first_name"],
+            "last_name": user_data["last_name"],
+            "email": user_data["email"],
+            "phone": user_data["phone"]
+        }
+    )
+    await page.set_input_files("input[type='file']", files=[resume_payload(user_data["resume_path"])])
+    await page.click("button[type='submit']")
+
+# One handler per ATS, keyed by registrable domain. Adding a new board is a
+# new fill_* coroutine plus an entry here — no growing if-elif chain. Must be
+# defined before the Playwright bootstrap below: _new_context reads it while
+# pre-filling the context pool at import time.
+ATS_HANDLERS = {
+    "greenhouse.io": fill_greenhouse
+}
+
+def ats_for(url):
+    host = urlparse(url).netloc
+    for domain in ATS_HANDLERS:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return None
+
+# Playwright setup: one browser for the whole process, plus a small pool of
+# pre-warmed contexts so concurrent /submit requests never pay Chromium
+# startup cost. Everything Playwright-related runs on a dedicated asyncio
+# loop in a background thread; Flask request threads hand coroutines to it
+# via run_async(). The pool size doubles as the concurrency cap — at most
+# POOL_SIZE jobs navigate at once. Contexts are recycled after a fixed
+# number of uses to keep memory from creeping up on long-running workers.
+POOL_SIZE = 8
+MAX_USES_PER_INSTANCE = 25
+
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, daemon=True).start()
+
+def run_async(coro):
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+# The bot only reads and fills form fields, so images, webfonts, styling and
+# media are wasted bandwidth on every navigation.
+_BLOCKED_RESOURCES = {"image", "font", "stylesheet", "media"}
+
+async def _block_static(route):
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+def _storage_state_path(ats):
+    return os.path.join(COOKIE_DIR, f"{ats}.json")
+
+# Concurrent jobs on the same ATS all persist to one cookie file; the
+# per-ATS lock keeps their snapshots from interleaving and the atomic
+# tmp+replace write means readers only ever see complete JSON.
+_state_locks = {}
+
+async def _persist_storage_state(ctx, ats):
+    lock = _state_locks.setdefault(ats, asyncio.Lock())
+    async with lock:
+        state = await ctx.storage_state()
+        await asyncio.get_running_loop().run_in_executor(
+            IO_POOL, _write_json_atomic, _storage_state_path(ats), state)
+
+async def _new_context(browser):
+    # Seed new contexts with saved ATS cookies so repeat applications skip
+    # any bot-check challenge a previous run already cleared.
+    for ats in ATS_HANDLERS:
+        state = _storage_state_path(ats)
+        if os.path.exists(state):
+            try:
+                return await browser.new_context(storage_state=state)
+            except Exception as e:
+                # One bad cookie file must not brick context creation.
+                print(f"⚠️ Discarding unreadable storage state {state}: {e}")
+                try:
+                    os.remove(state)
+                except OSError:
+                    pass
+    return await browser.new_context()
+
+async def _start_playwright():
+    pw = await async_playwright().start()
+    browser = await pw.chromium.launch(headless=True)
+    pool = asyncio.Queue(maxsize=POOL_SIZE)
+    for _ in range(POOL_SIZE):
+        pool.put_nowait({"ctx": await _new_context(browser), "uses": 0})
+    return pw, browser, pool
+
+_pw, _browser, _ctx_pool = run_async(_start_playwright())
+
+@asynccontextmanager
+async def borrow_context():
+    # The slot goes back on every path. Worn-out contexts are retired to a
+    # {"ctx": None} sentinel and replaced lazily on the next borrow, so a
+    # failed replacement (browser crash, bad storage-state file) can neither
+    # leak the slot nor turn an already-finished job into a failure.
+    entry = await _ctx_pool.get()
+    try:
+        if entry["ctx"] is None:
+            entry["ctx"] = await _new_context(_browser)
+            entry["uses"] = 0
+        yield entry["ctx"]
+    finally:
+        entry["uses"] += 1
+        if entry["ctx"] is not None and entry["uses"] >= MAX_USES_PER_INSTANCE:
+            try:
+                await entry["ctx"].close()
+            except Exception:
+                pass
+            entry = {"ctx": None, "uses": 0}
+        _ctx_pool.put_nowait(entry)
+
+def _shutdown_playwright():
+    async def _close():
+        try:
+            await _browser.close()
+        except Exception:
+            pass
+        await _pw.stop()
+    run_async(_close())
+    _loop.call_soon_threadsafe(_loop.stop)
+
+atexit.register(_shutdown_playwright)
+
+def copy_upload(src_path, dst_path):
+    # Copy in-kernel where possible; never pull the whole file into memory.
+    # sendfile may move fewer bytes than asked, so loop on the returned
+    # count until the whole file is across.
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    raise OSError(f"sendfile stopped at {offset}/{size} bytes")
+                offset += sent
+        except (AttributeError, OSError):
+            if offset:
+                # Partial in-kernel copy already landed in dst; a buffered
+                # restart would corrupt the file, so fail loudly instead.
+                raise
+            src.seek(0)
+            shutil.copyfileobj(src, dst, length=1024 * 1024)
+
 def get_user_inputs():
     job_title = input("Job Title (e.g. Cashier): ")
     location = input("Location (e.g. New York, NY): ")
@@ -47,12 +313,11 @@ def get_user_inputs():
         exit()
 
     password = input("Enter your password: ")
-    doc_ref = db.collection("users").document(email)
+    doc_ref = user_ref(email)
     doc = doc_ref.get()
 
     if doc.exists:
-        stored_hash = doc.to_dict().get("password_hash")
-        if not stored_hash or not bcrypt.checkpw(password.encode(), stored_hash.encode()):
+        if not verify_password(doc.to_dict().get("password_hash"), password):
             print("❌ Incorrect password. Please try again.")
             exit()
     else:
@@ -60,24 +325,25 @@ def get_user_inputs():
         if password != confirm:
             print("❌ Passwords do not match.")
             exit()
-        hashed_pw = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        hashed_pw = PH.hash(password)
 
     resume_path = input("Path to Resume File (e.g. resume.pdf): ")
     profile_photo = input("(Optional) Path to Profile Photo: ") or None
     preferred_salary = input("Preferred Salary (optional): ")
     num_jobs = int(input("How many jobs would you like to apply to?: "))
 
+    # The resume copy stays synchronous — apply_to_job uploads it from disk.
+    # The photo is never read again, so its copy can finish in the background.
     resume_filename = os.path.basename(resume_path)
     saved_resume_path = os.path.join(UPLOAD_DIR, resume_filename)
-    with open(resume_path, "rb") as src, open(saved_resume_path, "wb") as dst:
-        dst.write(src.read())
+    copy_upload(resume_path, saved_resume_path)
 
     profile_photo_path = None
     if profile_photo:
         profile_filename = os.path.basename(profile_photo)
         profile_photo_path = os.path.join(UPLOAD_DIR, profile_filename)
-        with open(profile_photo, "rb") as src, open(profile_photo_path, "wb") as dst:
-            dst.write(src.read())
+        IO_POOL.submit(copy_upload, profile_photo, profile_photo_path).add_done_callback(
+            _report_background_error(f"profile photo {profile_photo}"))
 
     return {
         "job_title": job_title.strip(),
@@ -94,9 +360,9 @@ def get_user_inputs():
     }
 
 def save_user_data(user_input):
-    now = datetime.datetime.utcnow().isoformat()
+    now = utc_now_iso()
     email = user_input["email"]
-    doc_ref = db.collection("users").document(email)
+    doc_ref = user_ref(email)
     doc = doc_ref.get()
 
     updates = {
@@ -110,7 +376,7 @@ def save_user_data(user_input):
     }
 
     if doc.exists:
-        doc_ref.update(updates)
+        doc_ref.set(updates, merge=True)
         print("📬 Updated user preferences in Firestore.")
     else:
         new_user_data = {
@@ -128,24 +394,34 @@ def save_user_data(user_input):
         doc_ref.set(new_user_data)
         print("✅ New user created and saved to Firestore!")
 
-    with open("user_data.json", "w") as f:
-        json.dump(user_input, f, indent=4)
+    IO_POOL.submit(_write_json_atomic, "user_data.json", user_input).add_done_callback(
+        _report_background_error("user_data.json"))
     print("✅ User data saved to user_data.json")
 
 def fetch_jobs(job_title, location, limit=10):
-    serp_api_key = config["SERP_API_KEY"]
     query = f"{job_title} in {location}"
     url = "https://serpapi.com/search"
     params = {
         "engine": "google_jobs",
         "q": query,
-        "api_key": serp_api_key,
+        "api_key": SERP_API_KEY,
         "hl": "en"
     }
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
-        jobs = data.get("jobs_results", [])[:limit]
+        def fetch_page(start):
+            response = SESSION.get(url, params={**params, "start": start}, timeout=10)
+            return response.json().get("jobs_results", [])
+
+        # SerpAPI returns 10 results per page; fetch extra pages concurrently
+        # when the user asks for more.
+        starts = range(0, limit, 10)
+        if limit > 10:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                pages = list(pool.map(fetch_page, starts))
+        else:
+            pages = [fetch_page(0)]
+
+        jobs = [job for page in pages for job in page][:limit]
 
         results = []
         for job in jobs:
@@ -160,49 +436,66 @@ def fetch_jobs(job_title, location, limit=10):
         print(f"❌ Failed to fetch jobs: {e}")
         return []
 
-def apply_to_job(job, user_data):
-    try:
-        email = user_data["email"]
-        doc_ref = db.collection("users").document(email)
-        doc = doc_ref.get()
-        if doc.exists:
-            counts = doc.to_dict()
-            if counts.get("free_uses_left", 0) <= 0:
-                print("⛔ You're out of free job applications.\nUpgrade to a plan to keep applying!")
-                exit()
-
-        url = job["link"]
-        if not url or "http" not in url:
-            return "Skipped (invalid link)"
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            page = browser.new_page()
-            page.goto(url, timeout=60000)
-
-            domain = page.url
-            screenshot_path = os.path.join(SCREENSHOT_DIR, f"{job['title'].replace(' ', '_')}_{job['company'].replace(' ', '_')}.png")
-            page.screenshot(path=screenshot_path)
-
-            if "greenhouse.io" in domain:
-                page.fill("input[name='first_name']", user_data["first_name"])
-                page.fill("input[name='last_name']", user_data["last_name"])
-                page.fill("input[type='email']", user_data["email"])
-                page.fill("input[type='tel']", user_data["phone"])
-                page.set_input_files("input[type='file']", user_data["resume_path"])
-                page.click("button[type='submit']")
-
-            browser.close()
-
-            doc_ref.update({
-                "application_count": counts.get("application_count", 0) + 1,
-                "free_uses_left": max(0, counts.get("free_uses_left", 0) - 1)
-            })
+async def apply_to_job(job, user_data, user_state):
+    if user_state.get("free_uses_left", 0) <= 0:
+        print("⛔ You're out of free job applications.\nUpgrade to a plan to keep applying!")
+        return "Skipped (no free applications left)"
+
+    url = job["link"]
+    if not url or "http" not in url:
+        return "Skipped (invalid link)"
 
-            return "Success (screenshot taken)"
+    # Reserve the free use before the first await: gather starts every
+    # coroutine before any job finishes, so decrementing only after the
+    # browser work would let all N jobs pass the check above on one
+    # remaining use. Failed jobs give their reservation back.
+    user_state["free_uses_left"] = user_state.get("free_uses_left", 0) - 1
+    try:
+        async with borrow_context() as ctx:
+            page = await ctx.new_page()
+            try:
+                await page.route("**/*", _block_static)
+                # Form inputs exist at DOMContentLoaded; no need to wait for
+                # the full load event.
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+                if DEBUG_SCREENSHOTS:
+                    # Viewport-only JPEG encodes in a fraction of the time a
+                    # full-page PNG takes; production skips it entirely.
+                    name = _SANITIZE.sub("_", f"{job['title']}_{job['company']}")[:120]
+                    screenshot_path = os.path.join(SCREENSHOT_DIR, name + ".jpg")
+                    await page.screenshot(path=screenshot_path, type="jpeg", quality=60, full_page=False)
+
+                ats = ats_for(page.url)
+                if ats:
+                    await ATS_HANDLERS[ats](page, user_data)
+                    await _persist_storage_state(ctx, ats)
+            finally:
+                await page.close()
+
+            user_state["application_count"] = user_state.get("application_count", 0) + 1
+
+            return "Success (screenshot taken)" if DEBUG_SCREENSHOTS else "Success"
     except Exception as e:
+        user_state["free_uses_left"] = user_state.get("free_uses_left", 0) + 1
         return f"Failed ({e})"
 
+def apply_to_all_jobs(job_results, user_data, user_state):
+    async def _gather():
+        return await asyncio.gather(*(apply_to_job(job, user_data, user_state) for job in job_results))
+    statuses = run_async(_gather())
+
+    # One batched commit for the whole run instead of one update per job —
+    # N Firestore round-trips collapse into one.
+    applied = sum(1 for status in statuses if status.startswith("Success"))
+    if applied:
+        commit_batches([(user_ref(user_data["email"]), {
+            "application_count": user_state.get("application_count", 0),
+            "free_uses_left": user_state.get("free_uses_left", 0)
+        })])
+
+    return statuses
+
 def main():
     print("🎯 Jobblixor is starting up...\n")
     user_data = get_user_inputs()
@@ -210,14 +503,14 @@ def main():
 
     print("\n✅ User input collected and saved to user_data.json:\n")
     print(json.dumps(user_data, indent=2))
-    print(f"🔐 SERP_API_KEY loaded: {config['SERP_API_KEY']}")
+    print(f"🔐 SERP_API_KEY loaded: {SERP_API_KEY}")
 
     email = user_data["email"]
-    doc_ref = db.collection("users").document(email)
+    doc_ref = user_ref(email)
     doc = doc_ref.get()
+    user_state = doc.to_dict() if doc.exists else {}
     if doc.exists:
-        free_uses = doc.to_dict().get("free_uses_left", 0)
-        print(f"💡 You have {free_uses} free applications left before upgrade.")
+        print(f"💡 You have {user_state.get('free_uses_left', 0)} free applications left before upgrade.")
 
     job_results = fetch_jobs(user_data["job_title"], user_data["location"], limit=user_data["num_jobs"])
 
@@ -228,7 +521,8 @@ def main():
     print("\n🤖 Starting auto-apply bot...\n")
     for job in job_results:
         print(f"➡️ Visiting: {job['link']}")
-        status = apply_to_job(job, user_data)
+    statuses = apply_to_all_jobs(job_results, user_data, user_state)
+    for job, status in zip(job_results, statuses):
         print(f"❌ Error applying to {job['title']} at {job['company']} – {status}" if "Failed" in status else f"✅ Applied to {job['title']} at {job['company']} – {status}")
 
 app = Flask(__name__)
@@ -257,29 +551,33 @@ def submit():
     if not password:
         return jsonify({"status": "error", "message": "Missing password."}), 400
 
-    hashed_pw = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    hash_future = HASH_POOL.submit(PH.hash, password)
 
-    # Save uploaded files 
+    # Save uploaded files
     resume_file = request.files.get("resume")
     profile_photo = request.files.get("profilePhoto")
 
     resume_path = None
     profile_photo_path = None
 
+    # 1 MB buffer instead of werkzeug's 16 KB default — far fewer write
+    # syscalls for multi-MB resumes.
     if resume_file:
         resume_filename = os.path.join("uploads", resume_file.filename)
-        resume_file.save(resume_filename)
+        resume_file.save(resume_filename, buffer_size=1024 * 1024)
         resume_path = resume_filename
 
     if profile_photo:
         photo_filename = os.path.join("uploads", profile_photo.filename)
-        profile_photo.save(photo_filename)
+        profile_photo.save(photo_filename, buffer_size=1024 * 1024)
         profile_photo_path = photo_filename
 
-    now = datetime.datetime.utcnow().isoformat()
-    doc_ref = db.collection("users").document(email)
+    now = utc_now_iso()
+    doc_ref = user_ref(email)
     doc = doc_ref.get()
 
+    hashed_pw = hash_future.result()
+
     user_data = {
         "job_title": job_title,
         "location": location,
@@ -296,16 +594,10 @@ def submit():
     }
 
     if doc.exists:
-        # Get the old values you want to preserve
-        old_data = doc.to_dict()
-        # Only update fields that should change—preserve these:
-        user_data["free_uses_left"] = old_data.get("free_uses_left", 5)
-        user_data["application_count"] = old_data.get("application_count", 0)
-        user_data["plan_id"] = old_data.get("plan_id", "free")
-        user_data["subscription_status"] = old_data.get("subscription_status", "active")
-        user_data["created_at"] = old_data.get("created_at", now)
-        # Only update these fields—does NOT overwrite the whole doc
-        doc_ref.update(user_data)
+        # Merge-set only writes the fields in user_data — counters, plan and
+        # created_at are left untouched without round-tripping them first.
+        doc_ref.set(user_data, merge=True)
+        user_state = doc.to_dict()
     else:
         # New user: set default values
         user_data.update({
@@ -317,6 +609,7 @@ def submit():
             "stripe_customer_id": None
         })
         doc_ref.set(user_data)
+        user_state = dict(user_data)
     print("✅ User data saved to Firebase")
 
     # Start auto-apply
@@ -325,10 +618,12 @@ def submit():
 
     for job in job_results:
         print(f"➡️ Visiting: {job['link']}")
-        status = apply_to_job(job, user_data)
+    statuses = apply_to_all_jobs(job_results, user_data, user_state)
+    for job, status in zip(job_results, statuses):
         logs.append(f"{job['title']} at {job['company']} – {status}")
 
-    return jsonify({"status": "success", "log": logs})
+    return app.response_class(orjson.dumps({"status": "success", "log": logs}), mimetype="application/json")
 
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    # Local development only — production runs under gunicorn (see Procfile).
+    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 5000)))
\ No newline at end of file